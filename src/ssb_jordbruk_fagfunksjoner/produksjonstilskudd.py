@@ -1,5 +1,194 @@
+import functools
+import sys
+from collections.abc import Iterable
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import ClassVar
 
+VALID_MEASUREMENT_UNITS = frozenset(
+    {
+        "antall",
+        "dekar",
+        "kg",
+    }
+)
+
+
+# Not-found sentinel for validation lookups where None is a legitimate
+# (invalid) value that must still be reported.
+_MISSING = object()
+
+# Codes in the same group carry identical group tuples; share one frozen
+# (tuple, frozenset) pair per distinct membership instead of one per instance.
+_GROUPS_CACHE: dict[tuple[str, ...], tuple[tuple[str, ...], frozenset[str]]] = {}
+
+# One bit per distinct group name, assigned on first sight, so a code's
+# memberships collapse into a single int and intersection tests become
+# one bitwise AND.
+_GROUP_BITS: dict[str, int] = {}
+
+
+def _groups_mask(groups: Iterable[str]) -> int:
+    """Returns the combined bitmask for the given group names."""
+    mask = 0
+    for group in groups:
+        bit = _GROUP_BITS.get(group)
+        if bit is None:
+            bit = 1 << len(_GROUP_BITS)
+            _GROUP_BITS[group] = bit
+        mask |= bit
+    return mask
+
+
+def _normalize_categories(
+    categories: str | list[str] | None,
+) -> tuple[str, ...] | None:
+    """Returns the category names as a tuple, treating a bare string as one name."""
+    if categories is None:
+        return None
+    if isinstance(categories, str):
+        return (categories,)
+    return tuple(categories)
+
+
+def _add_prefix(codes: Iterable[str]) -> tuple[str, ...]:
+    """Returns the codes with the 'pk_' prefix added."""
+    return tuple(f"pk_{code}" for code in codes)
+
+
+class Produksjonskode:
+    """A single produksjonstilskudd code with its label and group memberships.
+
+    Each instance validates its fields on construction and registers itself in a
+    shared registry, making the full set of known codes available for lookups
+    without any separate bookkeeping.
+
+    Attributes:
+        code (str): The 3-digit produksjonstilskudd code.
+        label (str): Short description of the agricultural product the code covers.
+        groups (tuple[str, ...]): Names of the code groups the code belongs to.
+        groups_set (frozenset[str]): The same group names as a frozenset for O(1) membership tests.
+        groups_mask (int): Bitmask of the group memberships for one-AND intersection tests.
+        measured_in (str): Unit the code is reported in, one of VALID_MEASUREMENT_UNITS.
+        description (str | None): Optional longer description of the code.
+        replaces (tuple[str, ...]): Codes this code has replaced.
+        replaced_by (tuple[str, ...]): Codes that have replaced this code.
+    """
+
+    __slots__ = (
+        "code",
+        "description",
+        "groups",
+        "groups_mask",
+        "groups_set",
+        "label",
+        "measured_in",
+        "replaced_by",
+        "replaces",
+    )
+
+    _registry: ClassVar[list["Produksjonskode"]] = []
+
+    def __init__(
+        self,
+        code: str,
+        label: str,
+        groups: list[str],
+        measured_in: str,
+        description: str | None = None,
+        replaces: list[str] | None = None,
+        replaced_by: list[str] | None = None,
+    ) -> None:
+        """Validates the fields and registers the code in the shared registry.
+
+        Args:
+            code: The 3-digit produksjonstilskudd code.
+            label: Short description of the agricultural product.
+            groups: Names of the code groups the code belongs to.
+            measured_in: Unit the code is reported in.
+            description: Optional longer description of the code.
+            replaces: Codes this code has replaced.
+            replaced_by: Codes that have replaced this code.
+
+        Raises:
+            ValueError: If the code is not a 3-digit string, a group name is not
+                a string, or the measurement unit is unknown.
+            TypeError: If groups is not a list or tuple of group names.
+        """
+        if not (len(code) == 3 and code.isdigit()):
+            raise ValueError(
+                f"Code must be a string of exactly 3 digits, got {code!r}."
+            )
+        # A bare string is iterable and would silently decay into its
+        # characters; reject it along with any other non-sequence container.
+        if isinstance(groups, str) or not isinstance(groups, list | tuple):
+            raise TypeError(
+                f"groups must be a list of group names, got {type(groups).__name__}."
+            )
+        invalid_group = next(
+            (group for group in groups if not isinstance(group, str)), _MISSING
+        )
+        if invalid_group is not _MISSING:
+            raise ValueError(f"Group names must be strings, got {invalid_group!r}.")
+        if measured_in not in VALID_MEASUREMENT_UNITS:
+            raise ValueError(
+                f"Measurement unit must be one of {sorted(VALID_MEASUREMENT_UNITS)}, got {measured_in!r}."
+            )
+        # Interned like the group names: lookups hash/compare one shared
+        # object per code instead of duplicate 3-char strings.
+        self.code = sys.intern(code)
+        self.label = label
+        # Some source tables use [""] as a "no groups" sentinel; normalize it
+        # (and any other empty strings) away here so consumers never see it.
+        groups_key = tuple(sys.intern(group) for group in groups if group)
+        cached_groups = _GROUPS_CACHE.get(groups_key)
+        if cached_groups is None:
+            cached_groups = (groups_key, frozenset(groups_key))
+            _GROUPS_CACHE[groups_key] = cached_groups
+        self.groups, self.groups_set = cached_groups
+        self.groups_mask = _groups_mask(self.groups)
+        # Interned so the handful of distinct units share one string object
+        # and dict/set probes on the unit hit the pointer-equality fast path.
+        self.measured_in = sys.intern(measured_in)
+        self.description = description or None
+        self.replaces = tuple(replaces) if replaces is not None else ()
+        self.replaced_by = tuple(replaced_by) if replaced_by is not None else ()
+        self._registry.append(self)
+
+    def __str__(self) -> str:
+        """Returns a readable one-line summary of the code."""
+        return " ".join([self.code, self.label, f"({self.measured_in})"])
+
+    def __repr__(self) -> str:
+        """Returns an unambiguous representation of the code."""
+        return (
+            f"Produksjonskode(code={self.code!r}, label={self.label!r}, "
+            f"groups={list(self.groups)!r}, measured_in={self.measured_in!r})"
+        )
+
+
+_PRODUKSJONSKODER_REGISTRY = Produksjonskode._registry
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_columns() -> (
+    tuple[tuple[str, ...], tuple[tuple[str, ...], ...], tuple[str, ...]]
+):
+    """Returns parallel (codes, groups, measured_in) columns over the registry.
+
+    Bulk queries that touch one field of every registered code scan a flat
+    tuple instead of hopping between ~130 instances. The registry is frozen
+    after import, so the columns are built once and cached.
+
+    Returns:
+        A tuple of three equal-length tuples: codes, groups and measured_in.
+    """
+    _ensure_registry()
+    codes = tuple(kode.code for kode in _PRODUKSJONSKODER_REGISTRY)
+    groups = tuple(kode.groups for kode in _PRODUKSJONSKODER_REGISTRY)
+    measured_in = tuple(kode.measured_in for kode in _PRODUKSJONSKODER_REGISTRY)
+    return codes, groups, measured_in
+
 
 class Produksjonstilskudd:
     """A mapping class for produksjonstilskudd codes related to agricultural products.
@@ -19,254 +208,296 @@ class Produksjonstilskudd:
     Example:
         >>> pt = Produksjonstilskudd()
         >>> print(pt.get_codes('frukt_avling', prefix=True))
-        ['pk_001', 'pk_002', 'pk_003', 'pk_004', 'pk_005', 'pk_006']
+        ('pk_001', 'pk_002', 'pk_003', 'pk_004', 'pk_005', 'pk_006')
 
     Note:
         The class is designed with immutability in mind for the 'codes' attribute to ensure consistent and error-free usage.
     """
 
-    codes: ClassVar[dict[str, str]] = {
-        "001": "Epler",
-        "002": "Pærer",
-        "003": "Plommer",
-        "004": "Moreller",
-        "005": "Kirsebær",
-        "006": "Epler og pærer til press",
-        "011": "Jordbær",
-        "012": "Bringebær",
-        "013": "Solbær",
-        "014": "Rips",
-        "016": "Hageblåbær",
-        "021": "Stikkelsbær",
-        "022": "Industribær",
-        "031": "Tomat",
-        "032": "Slangeagurk",
-        "033": "Salat (også friland)",
-        "060": "Matpoteter i Nord-Norge",
-        "115": "Hester, under 3 år",
-        "116": "Hester, 3 år og eldre",
-        "118": "Ammekyr av minst 50% kjøttferase",
-        "119": "Øvrige storfe",
-        "120": "Melkekyr",
-        "121": "Ammekyr",
-        "139": "Melkesau",
-        "140": "Melkegeiter",
-        "142": "Ammegeiter",
-        "144": "Bukker og ungdyr, medregnet kje",
-        "145": "Søyer født i fjor eller tidligere",
-        "146": "Værer født i fjor eller tidligere",
-        "154": "Smågriser, levendevekt under 20kg eller alder inntil 8 uker",
-        "155": "Avlspurker som har fått minst 1 kull",
-        "156": "Råner som er satt inn i avl",
-        "157": "Slaktegriser, levendevekt minst 20kg",
-        "158": "Ungpurker bestemt for avl",
-        "159": "Ungråner bestemt for avl",
-        "161": "Verpehøner",
-        "162": "Rugeegg levert til rugeri",
-        "168": "Avlsdyr av ender, kalkuner og gjess",
-        "170": "Minktisper",
-        "171": "Revetisper",
-        "174": "Ender, kalkuner og gjess for slakt",
-        "175": "Livkyllinger",
-        "176": "Slaktekyllinger",
-        "178": "Hjort, 1 år og eldre",
-        "179": "Hjort, under 1 år",
-        "180": "Kaniner",
-        "181": "Griser solgt som livdyr, vekt på minst 50 kg",
-        "183": "Struts",
-        "185": "Kyllinger og kalkuner solgt som livdyr",
-        "192": "Esel",
-        "193": "Hester i pensjon i beitesesongen",
-        "194": "Bifolk",
-        "196": "Lama",
-        "197": "Alpakka",
-        "210": "Fulldyrket eng",
-        "211": "Overflatedyrket eng",
-        "212": "Innmarksbeite",
-        "213": "Andre grovforvekster til for",
-        "223": "Grønngjødsling",
-        "230": "Poteter",
-        "231": "Annet korn og frø som er berettiget tilskudd",
-        "235": "Engfør og annen såfrøproduksjon",
-        "236": "Erter, bønner og andre belgvekster til modning",
-        "237": "Oljevekster",
-        "238": "Rug og rughvete",
-        "239": "Korn til krossing",
-        "240": "Vårhvete",
-        "242": "Bygg",
-        "243": "Havre",
-        "245": "Erter og bønner til konservesindustri (høstet før modning)",
-        "247": "Høsthvete",
-        "264": "Grønnsaker på friland, inkl. matkålrot og urter",
-        "271": "Moreller og kirsebær",
-        "272": "Epler",
-        "273": "Pærer",
-        "274": "Plommer",
-        "280": "Jordbær",
-        "282": "Andre bærarter",
-        "283": "Andre fruktarter",
-        "285": "Planteskoleareal og blomsterdyrking på friland",
-        "290": "Brakka areal",
-        "292": "Fulldyrket og/eller overflatedyrket, ute av drift",
-        "293": "Innmarksbeite, ute av drift",
-        "294": "Areal i drift, men ikke berettiget produksjonstilskudd",
-        "410": "Storfe på utmarksbeite - Melkekyr og ammekyr",
-        "411": "Storfe på beite - Melkekyr og ammekyr",
-        "420": "Storfe på utmarksbeite - Øvrige storfe",
-        "422": "Storfe på beite - Øvrige storfe",
-        "431": "Sauer, født i fjor eller tidligere, utmarksbeite",
-        "432": "Lam, født i år, utmarksbeite",
-        "440": "Geiter, voksne og kje, utmarksbeite",
-        "445": "Geiter, voksne og kje, beitetilskudd",
-        "450": "Hester på utmarksbeite",
-        "455": "Hester på beite",
-        "480": "Lama på beite",
-        "481": "Alpakka på beite",
-        "486": "Hjort på beite",
-        "487": "Sauer, født i fjor eller tidligere, beitetilskudd",
-        "488": "Lam, født i år, beitetilskudd",
-        "521": "Salg av høy",
-        "522": "Salg av surfor",
-        "523": "Salg av høyensilasje",
-        "720": "Storfe på utmarksbeite - Kyr av bevaringsverdig rase",
-        "721": "Storfe på utmarksbeite - Okser av bevaringsverdig rase",
-        "722": "Søyer av bevaringsverdig rase",
-        "723": "Værer av bevaringsverdig rase",
-        "724": "Ammegeiter av bevaringsverdig rase",
-        "725": "Unghester under 3 år av bevaringsverdig rase",
-        "801": "Økologiske melkekyr",
-        "802": "Økologiske ammekyr",
-        "803": "Økologiske øvrige storfe",
-        "810": "Økologiske melkegeiter",
-        "811": "Økologiske ammegeiter",
-        "821": "Økologiske sauer",
-        "830": "Økologiske avlsgriser",
-        "833": "Økologiske griser solgt som livdyr",
-        "841": "Økologiske verpehøner",
-        "852": "Grønngjødsling, 2. års karens",
-        "855": "Korn til modning og krossing, økologisk samt 2.års karens",
-        "861": "Poteter, økologisk areal samt 2.års karens",
-        "863": "Frukt og bær, økologisk areal samt 2. og 3. års karens",
-        "864": "Grønnsaker, økologisk areal samt 2. års karens",
-        "870": "Annet areal (grovfôr), økologisk areal samt 2. års karens",
-        "871": "Innmarksbeite, økologisk areal",
-        "875": "Grønngjødsling, økologisk areal",
-        "876": "Areal brakka for å bekjempe ugras, økologisk eller 2. års karens",
-        "880": "Innmarksbeite i 1 års karens",
-        "881": "Grovforareal i 1 års karens",
-        "882": "Annet areal (enn grovfor) i 1 års karens",
-    }
+    codes: ClassVar[Mapping[str, str]] = MappingProxyType(
+        {
+            "001": "Epler",
+            "002": "Pærer",
+            "003": "Plommer",
+            "004": "Moreller",
+            "005": "Kirsebær",
+            "006": "Epler og pærer til press",
+            "011": "Jordbær",
+            "012": "Bringebær",
+            "013": "Solbær",
+            "014": "Rips",
+            "016": "Hageblåbær",
+            "021": "Stikkelsbær",
+            "022": "Industribær",
+            "031": "Tomat",
+            "032": "Slangeagurk",
+            "033": "Salat (også friland)",
+            "060": "Matpoteter i Nord-Norge",
+            "115": "Hester, under 3 år",
+            "116": "Hester, 3 år og eldre",
+            "118": "Ammekyr av minst 50% kjøttferase",
+            "119": "Øvrige storfe",
+            "120": "Melkekyr",
+            "121": "Ammekyr",
+            "139": "Melkesau",
+            "140": "Melkegeiter",
+            "142": "Ammegeiter",
+            "144": "Bukker og ungdyr, medregnet kje",
+            "145": "Søyer født i fjor eller tidligere",
+            "146": "Værer født i fjor eller tidligere",
+            "154": "Smågriser, levendevekt under 20kg eller alder inntil 8 uker",
+            "155": "Avlspurker som har fått minst 1 kull",
+            "156": "Råner som er satt inn i avl",
+            "157": "Slaktegriser, levendevekt minst 20kg",
+            "158": "Ungpurker bestemt for avl",
+            "159": "Ungråner bestemt for avl",
+            "161": "Verpehøner",
+            "162": "Rugeegg levert til rugeri",
+            "168": "Avlsdyr av ender, kalkuner og gjess",
+            "170": "Minktisper",
+            "171": "Revetisper",
+            "174": "Ender, kalkuner og gjess for slakt",
+            "175": "Livkyllinger",
+            "176": "Slaktekyllinger",
+            "178": "Hjort, 1 år og eldre",
+            "179": "Hjort, under 1 år",
+            "180": "Kaniner",
+            "181": "Griser solgt som livdyr, vekt på minst 50 kg",
+            "183": "Struts",
+            "185": "Kyllinger og kalkuner solgt som livdyr",
+            "192": "Esel",
+            "193": "Hester i pensjon i beitesesongen",
+            "194": "Bifolk",
+            "196": "Lama",
+            "197": "Alpakka",
+            "210": "Fulldyrket eng",
+            "211": "Overflatedyrket eng",
+            "212": "Innmarksbeite",
+            "213": "Andre grovforvekster til for",
+            "223": "Grønngjødsling",
+            "230": "Poteter",
+            "231": "Annet korn og frø som er berettiget tilskudd",
+            "235": "Engfør og annen såfrøproduksjon",
+            "236": "Erter, bønner og andre belgvekster til modning",
+            "237": "Oljevekster",
+            "238": "Rug og rughvete",
+            "239": "Korn til krossing",
+            "240": "Vårhvete",
+            "242": "Bygg",
+            "243": "Havre",
+            "245": "Erter og bønner til konservesindustri (høstet før modning)",
+            "247": "Høsthvete",
+            "264": "Grønnsaker på friland, inkl. matkålrot og urter",
+            "271": "Moreller og kirsebær",
+            "272": "Epler",
+            "273": "Pærer",
+            "274": "Plommer",
+            "280": "Jordbær",
+            "282": "Andre bærarter",
+            "283": "Andre fruktarter",
+            "285": "Planteskoleareal og blomsterdyrking på friland",
+            "290": "Brakka areal",
+            "292": "Fulldyrket og/eller overflatedyrket, ute av drift",
+            "293": "Innmarksbeite, ute av drift",
+            "294": "Areal i drift, men ikke berettiget produksjonstilskudd",
+            "410": "Storfe på utmarksbeite - Melkekyr og ammekyr",
+            "411": "Storfe på beite - Melkekyr og ammekyr",
+            "420": "Storfe på utmarksbeite - Øvrige storfe",
+            "422": "Storfe på beite - Øvrige storfe",
+            "431": "Sauer, født i fjor eller tidligere, utmarksbeite",
+            "432": "Lam, født i år, utmarksbeite",
+            "440": "Geiter, voksne og kje, utmarksbeite",
+            "445": "Geiter, voksne og kje, beitetilskudd",
+            "450": "Hester på utmarksbeite",
+            "455": "Hester på beite",
+            "480": "Lama på beite",
+            "481": "Alpakka på beite",
+            "486": "Hjort på beite",
+            "487": "Sauer, født i fjor eller tidligere, beitetilskudd",
+            "488": "Lam, født i år, beitetilskudd",
+            "521": "Salg av høy",
+            "522": "Salg av surfor",
+            "523": "Salg av høyensilasje",
+            "720": "Storfe på utmarksbeite - Kyr av bevaringsverdig rase",
+            "721": "Storfe på utmarksbeite - Okser av bevaringsverdig rase",
+            "722": "Søyer av bevaringsverdig rase",
+            "723": "Værer av bevaringsverdig rase",
+            "724": "Ammegeiter av bevaringsverdig rase",
+            "725": "Unghester under 3 år av bevaringsverdig rase",
+            "801": "Økologiske melkekyr",
+            "802": "Økologiske ammekyr",
+            "803": "Økologiske øvrige storfe",
+            "810": "Økologiske melkegeiter",
+            "811": "Økologiske ammegeiter",
+            "821": "Økologiske sauer",
+            "830": "Økologiske avlsgriser",
+            "833": "Økologiske griser solgt som livdyr",
+            "841": "Økologiske verpehøner",
+            "852": "Grønngjødsling, 2. års karens",
+            "855": "Korn til modning og krossing, økologisk samt 2.års karens",
+            "861": "Poteter, økologisk areal samt 2.års karens",
+            "863": "Frukt og bær, økologisk areal samt 2. og 3. års karens",
+            "864": "Grønnsaker, økologisk areal samt 2. års karens",
+            "870": "Annet areal (grovfôr), økologisk areal samt 2. års karens",
+            "871": "Innmarksbeite, økologisk areal",
+            "875": "Grønngjødsling, økologisk areal",
+            "876": "Areal brakka for å bekjempe ugras, økologisk eller 2. års karens",
+            "880": "Innmarksbeite i 1 års karens",
+            "881": "Grovforareal i 1 års karens",
+            "882": "Annet areal (enn grovfor) i 1 års karens",
+        }
+    )
 
-    code_groups: ClassVar[dict[str, list[str]]] = {
-        "frukt_avling": ["001", "002", "003", "004", "005", "006"],
-        "frukt_areal": ["271", "272", "273", "274", "283", "863"],
-        "baer_avling": ["011", "012", "013", "014", "016", "021", "022"],
-        "baer_areal": ["280", "282", "863"],
-        "groennsaker": ["031", "032", "033", "060", "230", "264", "861", "864", "285"],
-        "grovfor_areal": ["210", "211", "212", "213", "870", "871", "880", "881"],
-        "grovfor_salg": ["521", "522", "523"],
-        "korn": [
-            "231",
-            "235",
-            "236",
-            "237",
-            "238",
-            "239",
-            "240",
-            "242",
-            "243",
-            "245",
-            "247",
-            "855",
-        ],
-        "annet_areal": ["223", "290", "294", "876", "852", "875", "882"],
-        "areal_ute_av_drift": ["292", "293"],
-        "storfe": [
-            "118",
-            "119",
-            "120",
-            "121",
-            "410",
-            "411",
-            "420",
-            "422",
-            "720",
-            "721",
-            "801",
-            "802",
-            "803",
-        ],
-        "hester": ["115", "116", "193", "455", "450", "725"],
-        "småfe": [
-            "145",
-            "146",
-            "139",
-            "140",
-            "142",
-            "144",
-            "821",
-            "811",
-            "810",
-            "487",
-            "488",
-            "445",
-            "440",
-            "431",
-            "432",
-            "722",
-            "723",
-            "724",
-        ],
-        "griser": ["155", "156", "158", "159", "154", "157", "830", "181", "833"],
-        "fjørfe_og_rugeegg": ["161", "162", "168", "175", "176", "174", "841", "185"],
-        "pelsdyr": ["170", "171"],
-        "andre_husdyr": [
-            "178",
-            "179",
-            "180",
-            "183",
-            "192",
-            "194",
-            "196",
-            "197",
-            "480",
-            "481",
-            "486",
-        ],
-    }
+    code_groups: ClassVar[Mapping[str, list[str]]] = MappingProxyType(
+        {
+            "frukt_avling": ["001", "002", "003", "004", "005", "006"],
+            "frukt_areal": ["271", "272", "273", "274", "283", "863"],
+            "baer_avling": ["011", "012", "013", "014", "016", "021", "022"],
+            "baer_areal": ["280", "282", "863"],
+            "groennsaker": [
+                "031",
+                "032",
+                "033",
+                "060",
+                "230",
+                "264",
+                "861",
+                "864",
+                "285",
+            ],
+            "grovfor_areal": ["210", "211", "212", "213", "870", "871", "880", "881"],
+            "grovfor_salg": ["521", "522", "523"],
+            "korn": [
+                "231",
+                "235",
+                "236",
+                "237",
+                "238",
+                "239",
+                "240",
+                "242",
+                "243",
+                "245",
+                "247",
+                "855",
+            ],
+            "annet_areal": ["223", "290", "294", "876", "852", "875", "882"],
+            "areal_ute_av_drift": ["292", "293"],
+            "storfe": [
+                "118",
+                "119",
+                "120",
+                "121",
+                "410",
+                "411",
+                "420",
+                "422",
+                "720",
+                "721",
+                "801",
+                "802",
+                "803",
+            ],
+            "hester": ["115", "116", "193", "455", "450", "725"],
+            "småfe": [
+                "145",
+                "146",
+                "139",
+                "140",
+                "142",
+                "144",
+                "821",
+                "811",
+                "810",
+                "487",
+                "488",
+                "445",
+                "440",
+                "431",
+                "432",
+                "722",
+                "723",
+                "724",
+            ],
+            "griser": ["155", "156", "158", "159", "154", "157", "830", "181", "833"],
+            "fjørfe_og_rugeegg": [
+                "161",
+                "162",
+                "168",
+                "175",
+                "176",
+                "174",
+                "841",
+                "185",
+            ],
+            "pelsdyr": ["170", "171"],
+            "andre_husdyr": [
+                "178",
+                "179",
+                "180",
+                "183",
+                "192",
+                "194",
+                "196",
+                "197",
+                "480",
+                "481",
+                "486",
+            ],
+        }
+    )
 
-    combinations: ClassVar[dict[str, list[str]]] = {
-        "frukt": ["frukt_avling", "frukt_areal"],
-        "baer": ["baer_avling", "baer_areal"],
-        "grovfor": ["grovfor_areal", "grovfor_salg"],
-        "areal": ["grovfor", "korn", "annet_areal", "areal_ute_av_drift"],
-        "dyr": [
-            "hester",
-            "storfe",
-            "småfe",
-            "griser",
-            "fjørfe_og_rugeegg",
-            "pelsdyr",
-            "andre_husdyr",
-        ],
-        "frukt_baer_groennsaker": ["frukt", "baer", "groennsaker"],
-    }
+    combinations: ClassVar[Mapping[str, list[str]]] = MappingProxyType(
+        {
+            "frukt": ["frukt_avling", "frukt_areal"],
+            "baer": ["baer_avling", "baer_areal"],
+            "grovfor": ["grovfor_areal", "grovfor_salg"],
+            "areal": ["grovfor", "korn", "annet_areal", "areal_ute_av_drift"],
+            "dyr": [
+                "hester",
+                "storfe",
+                "småfe",
+                "griser",
+                "fjørfe_og_rugeegg",
+                "pelsdyr",
+                "andre_husdyr",
+            ],
+            "frukt_baer_groennsaker": ["frukt", "baer", "groennsaker"],
+        }
+    )
 
-    table_groups: ClassVar[dict[str, list[str]]] = {
-        "tabell_storfe": ["119", "120", "121"],  # brukes i statbank
-        "tabell_ku": ["120", "121"],  # brukes i statbank
-        "tabell_sau": ["145", "146", "139"],  # brukes i statbank
-        "tabell_avlssvin": ["155", "156", "158", "159"],  # brukes i statbank
-        "tabell_svin": ["154", "155", "156", "157", "158", "159"],  # brukes i statbank
-        "tabell_purker": ["155", "158"],  # brukes i statbank
-        "tabell_geit": ["140", "142", "144"],
-        "tabell_hest": ["115", "116"],
-        "tabell_pelsdyr": ["170", "171"],
-        "tabell_hjort": ["178", "179"],
-        "tabell_ok_storfe": ["801", "802", "803"],
-        "tabell_ok_ku": ["801", "802"],
-        "tabell_ok_mageit": ["810", "811"],
-    }
+    table_groups: ClassVar[Mapping[str, list[str]]] = MappingProxyType(
+        {
+            "tabell_storfe": ["119", "120", "121"],  # brukes i statbank
+            "tabell_ku": ["120", "121"],  # brukes i statbank
+            "tabell_sau": ["145", "146", "139"],  # brukes i statbank
+            "tabell_avlssvin": ["155", "156", "158", "159"],  # brukes i statbank
+            "tabell_svin": [
+                "154",
+                "155",
+                "156",
+                "157",
+                "158",
+                "159",
+            ],  # brukes i statbank
+            "tabell_purker": ["155", "158"],  # brukes i statbank
+            "tabell_geit": ["140", "142", "144"],
+            "tabell_hest": ["115", "116"],
+            "tabell_pelsdyr": ["170", "171"],
+            "tabell_hjort": ["178", "179"],
+            "tabell_ok_storfe": ["801", "802", "803"],
+            "tabell_ok_ku": ["801", "802"],
+            "tabell_ok_mageit": ["810", "811"],
+        }
+    )
+
+    # Shared name → code-dict index, built lazily by the first instance.
+    _shared_group_index: ClassVar[dict[str, dict[str, str]] | None] = None
+
+    # Pre-sorted once at class definition; group names are already unique
+    # dict keys, so no set round trip is needed either. Frozen as a tuple so
+    # no caller can mutate the shared class-level value.
+    categories: ClassVar[tuple[str, ...]] = tuple(sorted(code_groups))
 
     def __init__(self) -> None:
         """Initializes an instance of the Produksjonstilskudd class.
@@ -284,31 +515,78 @@ class Produksjonstilskudd:
         self._setup_dynamic_attributes()
 
     def _setup_dynamic_attributes(self) -> None:
-        # Set attributes for each code group
-        for group_name, codes in self.code_groups.items():
-            setattr(self, group_name, self._extract_from_codelist(codes))
+        # Inverted index mapping every group, combination and table name to its
+        # code dict. The tables are class-level constants, so the index is
+        # built once and shared by every instance instead of being recomputed
+        # per instantiation.
+        if Produksjonstilskudd._shared_group_index is None:
+            index: dict[str, dict[str, str]] = {}
+
+            # Set attributes for each code group
+            for group_name, codes in self.code_groups.items():
+                index[group_name] = self._extract_from_codelist(codes)
+
+            for combo_name in self.combinations:
+                self._resolve_combination(combo_name, index)
+
+            for table_name, codes in self.table_groups.items():
+                index[table_name] = self._extract_from_codelist(codes)
+
+            Produksjonstilskudd._shared_group_index = index
+
+        self._group_index = Produksjonstilskudd._shared_group_index
+        # The public attributes get shallow copies: handing out the shared
+        # dicts themselves would let a caller's mutation leak into every
+        # other instance and into the internal index.
+        for name, code_dict in self._group_index.items():
+            setattr(self, name, dict(code_dict))
+
+        # Measurement-unit index, so unit lookups don't rescan the registry.
+        self._measurement_index: dict[str, list[str]] = {
+            unit: [] for unit in VALID_MEASUREMENT_UNITS
+        }
+        code_column, _, measurement_column = _registry_columns()
+        for code, unit in zip(code_column, measurement_column, strict=True):
+            self._measurement_index[unit].append(code)
 
-        for combo_name, groups in self.combinations.items():
-            combined_dict: dict[str, str] = {}
-            for group in groups:
-                combined_dict.update(getattr(self, group, {}))
-            setattr(self, combo_name, combined_dict)
+        # Memoized results for the public lookup methods. The instance is
+        # effectively immutable, so results never go stale.
+        self._get_codes_cache: dict[
+            tuple[tuple[str, ...] | None, bool], tuple[str, ...]
+        ] = {}
+        self._measurement_cache: dict[tuple[str, bool], tuple[str, ...]] = {}
 
-        for table_name, codes in self.table_groups.items():
-            setattr(self, table_name, self._extract_from_codelist(codes))
+    def _resolve_combination(
+        self, name: str, index: dict[str, dict[str, str]]
+    ) -> dict[str, str]:
+        """Resolves a combination into its codes, following nested combinations.
+
+        Results are memoized in the shared index, so each combination is
+        expanded exactly once no matter how often or how deeply it is nested,
+        and definition order in the combinations table no longer matters.
+        """
+        resolved = index.get(name)
+        if resolved is not None:
+            return resolved
+        combined: dict[str, str] = {}
+        for member in self.combinations.get(name, ()):
+            if member in index:
+                combined.update(index[member])
+            elif member in self.combinations:
+                combined.update(self._resolve_combination(member, index))
+        index[name] = combined
+        return combined
 
     def _extract_from_codelist(self, numbers: list[str]) -> dict[str, str]:
-        result = {}
-        for code in numbers:
-            if code not in self.codes:
-                raise ValueError(f"Code {code} not found in codes dictionary.")
-            result[code] = self.codes[code]
-        return result
+        missing = set(numbers) - self.codes.keys()
+        if missing:
+            raise ValueError(f"Codes {sorted(missing)} not found in codes dictionary.")
+        return {code: self.codes[code] for code in numbers}
 
     def get_codes(
         self, attributes: str | list[str] | None = None, prefix: bool | None = False
-    ) -> list[str]:
-        """Returns a list of 3-digit codes from the specified attributes.
+    ) -> tuple[str, ...]:
+        """Returns a tuple of 3-digit codes from the specified attributes.
 
         If no attributes are specified, this method returns all 3-digit codes available. Optionally, a 'pk_' prefix can be added to each code.
 
@@ -321,30 +599,200 @@ class Produksjonstilskudd:
 
         Returns:
         -------
-        list of str
-            A list containing the requested 3-digit codes, optionally prefixed with 'pk_'.
+        tuple of str
+            A tuple containing the requested 3-digit codes, optionally prefixed with 'pk_'. The result is cached and immutable.
 
         Examples:
         --------
         >>> pt = Produksjonstilskudd()
         >>> pt.get_codes('frukt_avling', prefix=True)
-        ['pk_001', 'pk_002', 'pk_003', 'pk_004', 'pk_005', 'pk_006']
+        ('pk_001', 'pk_002', 'pk_003', 'pk_004', 'pk_005', 'pk_006')
 
         >>> pt.get_codes()
-        ['001', '002', '003', '004', '005', '006', '011', '012', '013', '014', '016', '021', '022', '031', '032', '033', '060', '115', '116', '118', '119', '120', '121', '139', '140', '142', '144', '145', '146', '154', '155', '156', '157', '158', '159', '161', '162', '168', '170', '171', '174', '175', '176', '178', '179', '180', '181', '183', '185', '192', '193', '194', '196', '197', '210', '211', '212', '213', '223', '230', '231', '235', '236', '237', '238', '239', '240', '242', '243', '245', '247', '264', '271', '272', '273', '274', '280', '282', '283', '285', '290', '292', '293', '294', '410', '411', '420', '422', '431', '432', '440', '445', '450', '455', '480', '481', '486', '487', '488', '521', '522', '523', '720', '721', '722', '723', '724', '725', '801', '802', '803', '810', '811', '821', '830', '833', '841', '852', '855', '861', '863', '864', '870', '871', '875', '876', '880', '881', '882']
+        ('001', '002', '003', '004', '005', '006', '011', '012', '013', '014', '016', '021', '022', '031', '032', '033', '060', '115', '116', '118', '119', '120', '121', '139', '140', '142', '144', '145', '146', '154', '155', '156', '157', '158', '159', '161', '162', '168', '170', '171', '174', '175', '176', '178', '179', '180', '181', '183', '185', '192', '193', '194', '196', '197', '210', '211', '212', '213', '223', '230', '231', '235', '236', '237', '238', '239', '240', '242', '243', '245', '247', '264', '271', '272', '273', '274', '280', '282', '283', '285', '290', '292', '293', '294', '410', '411', '420', '422', '431', '432', '440', '445', '450', '455', '480', '481', '486', '487', '488', '521', '522', '523', '720', '721', '722', '723', '724', '725', '801', '802', '803', '810', '811', '821', '830', '833', '841', '852', '855', '861', '863', '864', '870', '871', '875', '876', '880', '881', '882')
         """
-        if attributes:
-            if isinstance(attributes, str):  # Single attribute name
-                attributes = [attributes]  # Convert to list for consistency
-            codes = []
-            for attribute_name in attributes:
-                attribute_dict = getattr(self, attribute_name, {})
-                codes.extend(list(attribute_dict.keys()))
+        names = _normalize_categories(attributes) or None
+        key = (names, bool(prefix))
+        cached = self._get_codes_cache.get(key)
+        if cached is not None:
+            return cached
+
+        if names:
+            # Merge the group dicts' keys directly; the merged dict doubles as
+            # an ordered set, so codes shared between requested categories
+            # (e.g. "863" in frukt_areal and baer_areal) appear only once.
+            merged: dict[str, None] = {}
+            for attribute_name in dict.fromkeys(names):
+                merged.update(dict.fromkeys(self._group_index.get(attribute_name, {})))
+            codes: Iterable[str] = merged
         else:
             # No specific attributes provided, return all 3-digit codes
-            codes = list(self.codes.keys())
+            codes = self.codes
 
-        if prefix:
-            return ["pk_" + code for code in codes]
-        else:
-            return codes
+        result = _add_prefix(codes) if prefix else tuple(codes)
+        self._get_codes_cache[key] = result
+        return result
+
+    def get_codes_by_measurement(
+        self, measurement: str, prefix: bool | None = False
+    ) -> tuple[str, ...]:
+        """Returns all codes reported in the given measurement unit.
+
+        Args:
+            measurement: The unit to filter on, one of VALID_MEASUREMENT_UNITS.
+            prefix: Indicates whether to add a 'pk_' prefix to each code. Default is `False`.
+
+        Returns:
+            A tuple of the 3-digit codes reported in the unit, optionally prefixed with 'pk_'. The result is cached and immutable.
+
+        Raises:
+            ValueError: If the measurement unit is unknown.
+        """
+        if measurement not in VALID_MEASUREMENT_UNITS:
+            raise ValueError(
+                f"Measurement unit must be one of {sorted(VALID_MEASUREMENT_UNITS)}, got {measurement!r}."
+            )
+        key = (measurement, bool(prefix))
+        cached = self._measurement_cache.get(key)
+        if cached is None:
+            codes = self._measurement_index[measurement]
+            cached = _add_prefix(codes) if prefix else tuple(codes)
+            self._measurement_cache[key] = cached
+        return cached
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_by_code() -> dict[str, Produksjonskode]:
+    """Returns a code → Produksjonskode mapping over the registry."""
+    _ensure_registry()
+    return {kode.code: kode for kode in _PRODUKSJONSKODER_REGISTRY}
+
+
+def get_produksjonskode(code: str) -> Produksjonskode | None:
+    """Returns the registered Produksjonskode for a code, or None if unknown.
+
+    Args:
+        code: The 3-digit produksjonstilskudd code to look up.
+
+    Returns:
+        The matching Produksjonskode, or None when the code is not registered.
+    """
+    return _registry_by_code().get(code)
+
+
+def get_produksjonskoder(
+    categories: str | list[str] | None = None,
+) -> list[Produksjonskode]:
+    """Returns the registered Produksjonskode objects, optionally filtered by group.
+
+    Args:
+        categories: A group name or list of group names to filter on. If `None`,
+            every registered code is returned.
+
+    Returns:
+        The matching Produksjonskode objects, in registration order.
+    """
+    _ensure_registry()
+    names = _normalize_categories(categories)
+    if names is None:
+        return list(_PRODUKSJONSKODER_REGISTRY)
+    # Unknown names contribute no bits, so they simply never match.
+    wanted_mask = 0
+    for name in names:
+        wanted_mask |= _GROUP_BITS.get(name, 0)
+    return [
+        kode for kode in _PRODUKSJONSKODER_REGISTRY if kode.groups_mask & wanted_mask
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def get_produksjonstilskudd() -> Produksjonstilskudd:
+    """Returns a shared Produksjonstilskudd instance.
+
+    The underlying code tables are effectively immutable after import, so the
+    instance is built once and reused instead of re-running the attribute setup
+    on every call.
+
+    Returns:
+        The cached Produksjonstilskudd instance.
+    """
+    return Produksjonstilskudd()
+
+
+# Per-group measurement units, derived from the group semantics (harvest
+# weights in kg, areas in dekar, livestock head counts in antall) rather
+# than taken from an authoritative produksjonstilskudd source — confirm
+# against the Landbruksdirektoratet code list before relying on the units
+# downstream. The vocabulary is normalized to SSB's canonical unit names:
+# "kilo" is recorded as "kg" and "stykk" as "antall".
+_MEASUREMENT_UNIT_BY_GROUP = {
+    "frukt_avling": "kg",
+    "frukt_areal": "dekar",
+    "baer_avling": "kg",
+    "baer_areal": "dekar",
+    "groennsaker": "dekar",
+    "grovfor_areal": "dekar",
+    "grovfor_salg": "kg",
+    "korn": "dekar",
+    "annet_areal": "dekar",
+    "areal_ute_av_drift": "dekar",
+    "storfe": "antall",
+    "hester": "antall",
+    "småfe": "antall",
+    "griser": "antall",
+    "fjørfe_og_rugeegg": "antall",
+    "pelsdyr": "antall",
+    "andre_husdyr": "antall",
+}
+
+
+def _ensure_registry() -> None:
+    """Builds the registry on first use so importing the module stays cheap."""
+    if not _PRODUKSJONSKODER_REGISTRY:
+        _register_produksjonskoder()
+
+
+def _register_produksjonskoder() -> None:
+    """Populates the registry with one Produksjonskode per known code.
+
+    Raises:
+        ValueError: If a code in the codes table belongs to no code group,
+            since its measurement unit is derived from its first group.
+    """
+    for code, label in Produksjonstilskudd.codes.items():
+        groups = [
+            group
+            for group, members in Produksjonstilskudd.code_groups.items()
+            if code in members
+        ]
+        if not groups:
+            raise ValueError(
+                f"Code {code!r} has no code_groups entry, so its measurement "
+                "unit cannot be derived."
+            )
+        Produksjonskode(
+            code=code,
+            label=label,
+            groups=groups,
+            measured_in=_MEASUREMENT_UNIT_BY_GROUP[groups[0]],
+        )
+
+
+def __getattr__(name: str) -> Produksjonstilskudd:
+    """Lazily exposes PRODUKSJONSTILSKUDD, the shared frozen snapshot.
+
+    Using a module __getattr__ keeps import cheap: the snapshot (and with it
+    the registry) is only built the first time somebody asks for it.
+
+    Args:
+        name: The attribute being looked up.
+
+    Returns:
+        The cached Produksjonstilskudd instance.
+
+    Raises:
+        AttributeError: If any other missing attribute is requested.
+    """
+    if name == "PRODUKSJONSTILSKUDD":
+        return get_produksjonstilskudd()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,76 @@
+"""Shared fixtures for the test suite.
+
+The package is imported inside the fixture bodies rather than at module
+scope: conftest is loaded before ``pytest_configure``, and importing the
+package that early would leave it uninstrumented by typeguard's import hook.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonskode
+    from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonstilskudd
+
+
+@pytest.fixture(scope="session")
+def produksjonstilskudd_instance() -> Produksjonstilskudd:
+    """One shared instance for the whole run; the tests only read from it."""
+    from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonstilskudd
+
+    return Produksjonstilskudd()
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[None]:
+    """Give tests marked ``uses_registry`` a fresh, empty registry.
+
+    Both the class attribute and the module-level alias are swapped for the
+    same fresh list, so registration and the lookup helpers stay in sync;
+    monkeypatch undoes both swaps after the test. The lru_caches derived
+    from the registry are cleared on both sides of the test so the isolated
+    test never sees columns built from the real registry and never leaves
+    its own behind. Unmarked tests run against the real registry and skip
+    the setup entirely.
+    """
+    if request.node.get_closest_marker("uses_registry") is None:
+        yield
+        return
+    from ssb_jordbruk_fagfunksjoner import produksjonstilskudd as module
+
+    fresh: list[Produksjonskode] = []
+    monkeypatch.setattr(module.Produksjonskode, "_registry", fresh)
+    monkeypatch.setattr(module, "_PRODUKSJONSKODER_REGISTRY", fresh)
+    module._registry_columns.cache_clear()
+    module._registry_by_code.cache_clear()
+    yield
+    module._registry_columns.cache_clear()
+    module._registry_by_code.cache_clear()
+
+
+@pytest.fixture()
+def sample_codes() -> list[Produksjonskode]:
+    """A small, representative set of registered codes (one per unit)."""
+    from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonskode
+
+    return [
+        Produksjonskode(
+            code="001", label="Epler", groups=["frukt_avling"], measured_in="kg"
+        ),
+        Produksjonskode(
+            code="120", label="Melkekyr", groups=["storfe"], measured_in="antall"
+        ),
+        Produksjonskode(
+            code="210",
+            label="Fulldyrket eng",
+            groups=["grovfor_areal"],
+            measured_in="dekar",
+        ),
+    ]
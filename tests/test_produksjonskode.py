@@ -0,0 +1,102 @@
+from typing import cast
+
+import pytest
+
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonskode
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonstilskudd
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import _register_produksjonskoder
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import get_produksjonskode
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import get_produksjonskoder
+
+
+def _assert_registry_size(expected: int) -> None:
+    """Check the registry size, hiding this frame from failure tracebacks."""
+    __tracebackhide__ = True
+    actual = len(Produksjonskode._registry)
+    assert actual == expected, f"registry holds {actual} codes, expected {expected}"
+
+
+@pytest.mark.uses_registry
+def test_produksjonskode_registers_instance() -> None:
+    kode = Produksjonskode(
+        code="001", label="Epler", groups=["frukt_avling"], measured_in="kg"
+    )
+    _assert_registry_size(1)
+    assert Produksjonskode._registry[0] is kode
+
+
+@pytest.mark.parametrize("bad_code", ["1", "0011", "01a"])
+def test_produksjonskode_code_validation(bad_code: str) -> None:
+    """Codes must be strings of exactly 3 digits."""
+    with pytest.raises(ValueError):
+        Produksjonskode(
+            code=bad_code, label="Epler", groups=["frukt_avling"], measured_in="kg"
+        )
+
+
+@pytest.mark.parametrize("bad_groups", [["frukt_avling", 2], ["frukt_avling", None]])
+def test_produksjonskode_groups_validation(bad_groups: list[object]) -> None:
+    """Group names must all be strings."""
+    with pytest.raises(ValueError):
+        Produksjonskode(
+            code="001",
+            label="Epler",
+            groups=cast("list[str]", bad_groups),
+            measured_in="kg",
+        )
+
+
+def test_produksjonskode_groups_must_be_a_list() -> None:
+    """A bare string must not be iterated character-wise into group names."""
+    with pytest.raises(TypeError):
+        Produksjonskode(
+            code="001",
+            label="Epler",
+            groups=cast("list[str]", "frukt_avling"),
+            measured_in="kg",
+        )
+
+
+def test_produksjonskode_measurement_validation() -> None:
+    with pytest.raises(ValueError):
+        Produksjonskode(
+            code="001", label="Epler", groups=["frukt_avling"], measured_in="liter"
+        )
+
+
+@pytest.mark.uses_registry
+def test_all_codes_registered() -> None:
+    _register_produksjonskoder()
+    _assert_registry_size(len(Produksjonstilskudd.codes))
+
+
+@pytest.mark.uses_registry
+def test_produksjonskode_str(sample_codes: list[Produksjonskode]) -> None:
+    assert str(sample_codes[0]) == "001 Epler (kg)"
+
+
+@pytest.mark.uses_registry
+def test_get_produksjonskoder_filters_by_group(
+    sample_codes: list[Produksjonskode],
+) -> None:
+    epler = sample_codes[0]
+    assert get_produksjonskoder("frukt_avling") == [epler]
+    assert len(get_produksjonskoder()) == len(sample_codes)
+
+
+@pytest.mark.uses_registry
+def test_produksjonskode_empty_group_sentinel() -> None:
+    """The [""] sentinel and empty descriptions are normalized at construction."""
+    kode = Produksjonskode(
+        code="999", label="Testkode", groups=[""], measured_in="antall", description=""
+    )
+    assert kode.groups == ()
+    assert kode.groups_set == frozenset()
+    assert kode.description is None
+
+
+def test_get_produksjonskode_lookup() -> None:
+    kode = get_produksjonskode("120")
+    assert kode is not None
+    assert kode.label == "Melkekyr"
+    assert get_produksjonskode("000") is None
@@ -1,11 +1,10 @@
 import pytest
 
+from ssb_jordbruk_fagfunksjoner import produksjonstilskudd
 from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import Produksjonstilskudd
+from ssb_jordbruk_fagfunksjoner.produksjonstilskudd import get_produksjonstilskudd
 
-
-@pytest.fixture()
-def produksjonstilskudd_instance() -> Produksjonstilskudd:
-    return Produksjonstilskudd()
+_EXPECTED_CATEGORIES = frozenset(Produksjonstilskudd.code_groups)
 
 
 def test_get_codes_with_prefix(
@@ -13,8 +12,9 @@ def test_get_codes_with_prefix(
 ) -> None:
     """Test that get_codes correctly adds 'pk_' prefix."""
     prefixed_codes = produksjonstilskudd_instance.get_codes("frukt_avling", prefix=True)
-    for code in prefixed_codes:
-        assert code.startswith("pk_"), "All codes should be prefixed with 'pk_'"
+    assert all(
+        code.startswith("pk_") for code in prefixed_codes
+    ), "All codes should be prefixed with 'pk_'"
 
 
 def test_get_codes_without_prefix(
@@ -22,10 +22,18 @@ def test_get_codes_without_prefix(
 ) -> None:
     """Test that get_codes returns codes without prefix by default."""
     codes = produksjonstilskudd_instance.get_codes("frukt_avling")
-    for code in codes:
-        assert not code.startswith(
-            "pk_"
-        ), "Codes should not have 'pk_' prefix by default"
+    assert not any(
+        code.startswith("pk_") for code in codes
+    ), "Codes should not have 'pk_' prefix by default"
+
+
+@pytest.mark.parametrize("category", ["frukt_avling", "storfe", "korn"])
+def test_get_codes_single_category(
+    produksjonstilskudd_instance: Produksjonstilskudd, category: str
+) -> None:
+    """Each category returns exactly the codes listed for it in code_groups."""
+    codes = produksjonstilskudd_instance.get_codes(category)
+    assert codes == tuple(Produksjonstilskudd.code_groups[category])
 
 
 def test_get_codes_all(produksjonstilskudd_instance: Produksjonstilskudd) -> None:
@@ -70,3 +78,44 @@ def test_dynamic_tabell_creation(
     assert isinstance(
         produksjonstilskudd_instance.tabell_storfe, dict
     ), "'tabell_storfe' should be a dictionary"
+
+
+def test_get_produksjonstilskudd_is_cached() -> None:
+    """Repeated calls should return the same shared instance."""
+    assert get_produksjonstilskudd() is get_produksjonstilskudd()
+
+
+def test_categories_sorted(produksjonstilskudd_instance: Produksjonstilskudd) -> None:
+    """The categories attribute lists every code group name in sorted order."""
+    categories = produksjonstilskudd_instance.categories
+    assert frozenset(categories) == _EXPECTED_CATEGORIES
+    assert list(categories) == sorted(_EXPECTED_CATEGORIES)
+
+
+def test_get_codes_by_measurement(
+    produksjonstilskudd_instance: Produksjonstilskudd,
+) -> None:
+    """Codes filtered by measurement unit match their group's unit."""
+    antall_codes = produksjonstilskudd_instance.get_codes_by_measurement("antall")
+    assert "120" in antall_codes, "Livestock codes are counted in 'antall'"
+    assert "210" not in antall_codes, "Area codes are not counted in 'antall'"
+
+
+def test_get_codes_by_measurement_unknown_unit(
+    produksjonstilskudd_instance: Produksjonstilskudd,
+) -> None:
+    with pytest.raises(ValueError):
+        produksjonstilskudd_instance.get_codes_by_measurement("liter")
+
+
+def test_get_codes_deduplicates_across_categories(
+    produksjonstilskudd_instance: Produksjonstilskudd,
+) -> None:
+    """A code in several requested categories is only returned once."""
+    codes = produksjonstilskudd_instance.get_codes(["frukt_areal", "baer_areal"])
+    assert codes.count("863") == 1
+
+
+def test_module_level_snapshot() -> None:
+    """PRODUKSJONSTILSKUDD resolves lazily to the shared cached instance."""
+    assert produksjonstilskudd.PRODUKSJONSTILSKUDD is get_produksjonstilskudd()